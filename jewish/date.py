@@ -18,10 +18,19 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import bisect
 import datetime
 
+try:
+    from functools import lru_cache
+except ImportError:
+    # Python 2 has no lru_cache, so just do without caching there.
+    def lru_cache(maxsize=128):
+        return lambda function: function
+
 HALAKIM_PER_HOUR = 1080
 HALAKIM_PER_DAY = 25920
+HALAKIM_PER_WEEK = 7 * HALAKIM_PER_DAY
 HALAKIM_PER_LUNAR_CYCLE = 29 * HALAKIM_PER_DAY + 13753
 HALAKIM_PER_METONIC_CYCLE = HALAKIM_PER_LUNAR_CYCLE * (12 * 19 + 7)
 
@@ -33,15 +42,46 @@ _SUNDAY = 0
 _MONDAY = 1
 _TUESDAY = 2
 _WEDNESDAY = 3
+_THURSDAY = 4
 _FRIDAY = 5
+_SATURDAY = 6
+
+# Bit n is set if Tishrei 1 may not fall on day n of the week (rule 1).
+_ADU_MASK = (1 << _SUNDAY) | (1 << _WEDNESDAY) | (1 << _FRIDAY)
 
 _NOON = 18 * HALAKIM_PER_HOUR
 _AM3_11_20 = 9 * HALAKIM_PER_HOUR + 204
 _AM9_32_43 = 15 * HALAKIM_PER_HOUR + 589
 
 LEAP_YEARS = set((2, 5, 7, 10, 13, 16, 18))
+# Bit n is set if year n of the metonic cycle is a leap year.
+_LEAP_MASK = sum(1 << year for year in LEAP_YEARS)
 _YEAR_OFFSET = (0, 12, 24, 37, 49, 61, 74, 86, 99, 111, 123, 136, 148, 160,
                 173, 185, 197, 210, 222)
+_YEAR_OFFSET_HALAKIM = tuple(HALAKIM_PER_LUNAR_CYCLE * months
+                             for months in _YEAR_OFFSET)
+
+_MONTH_NAMES = ('Tishrei', 'Cheshvan', 'Kislev', 'Tevet', 'Shevat', 'Adar I',
+                'Adar II', 'Nisan', 'Iyar', 'Sivan', 'Tamuz', 'Av', 'Elul')
+
+# The 14 possible types of year (keviyot). Each is a tuple of (day of week of
+# Tishrei 1, year length, length of Cheshvan, length of Kislev, is leap year).
+KEVIYAH_TABLE = (
+    (_MONDAY, 353, 29, 29, False),
+    (_MONDAY, 355, 30, 30, False),
+    (_TUESDAY, 354, 29, 30, False),
+    (_THURSDAY, 354, 29, 30, False),
+    (_THURSDAY, 355, 30, 30, False),
+    (_SATURDAY, 353, 29, 29, False),
+    (_SATURDAY, 355, 30, 30, False),
+    (_MONDAY, 383, 29, 29, True),
+    (_MONDAY, 385, 30, 30, True),
+    (_TUESDAY, 384, 29, 30, True),
+    (_THURSDAY, 383, 29, 29, True),
+    (_THURSDAY, 385, 30, 30, True),
+    (_SATURDAY, 383, 29, 29, True),
+    (_SATURDAY, 385, 30, 30, True),
+)
 
 class JewishDateError(Exception):
     """Parent for all exceptions defined in jewish.date."""
@@ -50,49 +90,25 @@ class InvalidDateError(JewishDateError):
     """Error arising from attempting to calculate based on an invalid date."""
 
 def months_in_metonic_year(year):
-    return 13 if year in LEAP_YEARS else 12
+    # Negative years can't be shifted by, and aren't leap years.
+    return 13 if year >= 0 and (_LEAP_MASK >> year) & 1 else 12
+
+# The number of halakim from the molad of Tishrei of each year of the metonic
+# cycle to the next one.
+_YEAR_HALAKIM = tuple(HALAKIM_PER_LUNAR_CYCLE * months_in_metonic_year(year)
+                      for year in range(19))
 
 def metonic_year(year):
     return (year - 1) % 19
 
 def is_leap_year(year):
-    return metonic_year(year) in LEAP_YEARS
-
-class _Molad(object):
-
-    def __init__(self, day=0, halakim=0):
-        self.day = day
-        self.halakim = halakim
-        self._fix()
-
-    def _fix(self):
-        """Adjusts day and halakim so halakim < HALAKIM_PER_DAY."""
-        self.day += self.halakim // HALAKIM_PER_DAY
-        self.halakim %= HALAKIM_PER_DAY
-
-    def _add_halakim(self, halakim):
-        self.halakim += halakim
-        self._fix()
-        return self
-
-    def add_lunar_cycles(self, lunarCycles):
-        self._add_halakim(HALAKIM_PER_LUNAR_CYCLE * lunarCycles)
-        return self
-
-    def add_metonic_cycles(self, metonicCycles):
-        self._add_halakim(HALAKIM_PER_METONIC_CYCLE * metonicCycles)
-        return self
-
-    def day_of_week(self):
-        return self.day % 7
-
-    def __repr__(self):
-        return '_Molad(day=%s, halakim=%s)' % (self.day, self.halakim)
-
+    return (_LEAP_MASK >> metonic_year(year)) & 1 == 1
 
 class JewishDate(object):
     """A date in the Jewish calendar."""
 
+    __slots__ = ('year', 'month', 'day', 'isLeapYear')
+
     TISHREI = 1
     CHESHVAN = 2
     KISLEV = 3
@@ -144,86 +160,43 @@ class JewishDate(object):
             InvalidDateError: if the input SDN is before the beginning of
                               Jewish year 1
         """
-        if sdn <= _JEWISH_SDN_OFFSET:
-            raise InvalidDateError(
-                'Serial day number %s is before the first Jewish year' % sdn)
-        inputDay = sdn - _JEWISH_SDN_OFFSET
-
-        def get_result():
-            return cls(year, month, day)
-
-        metonicCycle, metonicYear, molad = _find_nearby_tishrei_molad(inputDay)
-        tishrei1 = _get_first_day_of_year(metonicYear, molad)
-
-        if inputDay >= tishrei1:
-            # It found Tishrei 1 at the start of the year
-            year = metonicCycle * 19 + metonicYear + 1
-            if inputDay < tishrei1 + 59:
-                if inputDay < tishrei1 + 30:
-                    month = cls.TISHREI
-                    day = inputDay - tishrei1 + 1
-                else:
-                    month = cls.CHESHVAN
-                    day = inputDay - tishrei1 - 29
-                return get_result()
-            else:
-                # Date is in Kislev
-                molad.add_lunar_cycles(months_in_metonic_year(metonicYear))
-                nextTishrei1 = _get_first_day_of_year((metonicYear + 1) % 19,
-                                                      molad)
-        else:
-            # It found Tishrei 1 at the end of the year
-            nextTishrei1 = tishrei1
-            year = metonicCycle * 19 + metonicYear
-            if inputDay >= nextTishrei1 - 177:
-                # It is one of the last 6 months of the year
-                for month, offset in (
-                        (cls.ELUL, 30),
-                        (cls.AV, 60),
-                        (cls.TAMUZ, 89),
-                        (cls.SIVAN, 119),
-                        (cls.IYAR, 148),
-                        (cls.NISAN, 178)):
-                    if inputDay > nextTishrei1 - offset:
-                        day = inputDay - nextTishrei1 + offset
-                        break
-                return get_result()
+        return cls(*_from_sdn(sdn))
+
+    @classmethod
+    def from_sdns(cls, sdns):
+        """Convert many serial day numbers (SDNs) without creating JewishDates.
+
+        Any iterable of SDNs is accepted, but this is only faster than calling
+        from_sdn repeatedly when the input contains runs of consecutive days,
+        such as a range of dates.
+
+        Args:
+            sdns: an iterable of serial day numbers
+
+        Returns:
+            three lists (years, months, days) of the same length as sdns, where
+            the i-th entry of each gives the date of the i-th SDN
+
+        Raises:
+            InvalidDateError: if any input SDN is before the beginning of
+                              Jewish year 1
+        """
+        years = []
+        months = []
+        days = []
+        nextSdn = None
+        for sdn in sdns:
+            # Every month has at least 29 days, so the day after one of the
+            # first 28 days of a month is always in the same month.
+            if sdn == nextSdn and day < 29:
+                day += 1
             else:
-                day = inputDay - nextTishrei1 + 207
-                if day > 0:
-                    month = cls.ADAR_II
-                    return get_result()
-                if is_leap_year(year):
-                    day += 30
-                    if day > 0:
-                        month = cls.ADAR_I
-                        return get_result()
-                day += 30
-                if day > 0:
-                    month = cls.SHEVAT
-                    return get_result()
-                day += 29
-                if day > 0:
-                    month = cls.TEVET
-                    return get_result()
-
-                # We need the length of the year to figure this out, so find
-                # Tishrei 1 of this year.
-                metonicCycle, metonicYear, molad = _find_nearby_tishrei_molad(
-                    molad.day - 365)
-                tishrei1 = _get_first_day_of_year(metonicYear, molad)
-
-        yearLength = nextTishrei1 - tishrei1
-        day = inputDay - tishrei1 - 29
-        cheshvanLength = 30 if yearLength in (355, 385) else 29
-        if day <= cheshvanLength:
-            month = cls.CHESHVAN
-            return get_result()
-        else:
-            day -= cheshvanLength
-        # There's only one option left
-        month = cls.KISLEV
-        return get_result()
+                year, month, day = _from_sdn(sdn)
+            nextSdn = sdn + 1
+            years.append(year)
+            months.append(month)
+            days.append(day)
+        return years, months, days
 
     @classmethod
     def from_date(cls, date):
@@ -248,51 +221,23 @@ class JewishDate(object):
         day = self.day
         if year <= 0 or day <= 0 or day > 30:
             raise self._invalid_date_error()
-        metonicCycle, metonicYear, molad, tishrei1 = _find_start_of_year(year)
-        molad.add_lunar_cycles(months_in_metonic_year(metonicYear))
-        nextTishrei1= _get_first_day_of_year((metonicYear + 1) % 19, molad)
-        yearLength = nextTishrei1 - tishrei1
-        adarsLength = 59 if self.isLeapYear else 29
-        offset = {
-            self.TISHREI: -1,
-            self.CHESHVAN: 29,
-            # Kislev is variable
-            self.TEVET: adarsLength + 237,
-            self.SHEVAT: adarsLength + 208,
-            self.ADAR_I: adarsLength + 178,
-            self.ADAR_II: 207,
-            self.NISAN: 178,
-            self.IYAR: 148,
-            self.SIVAN: 119,
-            self.TAMUZ: 89,
-            self.AV: 60,
-            self.ELUL: 30,
-        }
-
-        if month in (self.TISHREI, self.CHESHVAN):
-            sdn = tishrei1 + day + offset[month]
-        elif month == self.KISLEV:
-            if yearLength in (355, 385):
-                sdn = tishrei1 + day + 59
-            else:
-                sdn = tishrei1 + day + 58
-        else:
-            try:
-                sdn = nextTishrei1 + day - offset[month]
-            except KeyError:
-                raise self._invalid_date_error()
-        return sdn + _JEWISH_SDN_OFFSET
+        try:
+            return _to_sdn(year, month, day)
+        except KeyError:
+            raise self._invalid_date_error()
 
     def to_date(self):
         return datetime.date.fromordinal(self.to_sdn() - _GREGORIAN_SDN_OFFSET)
 
     def english_month_name(self):
-        names = ('Tishrei', 'Cheshvan', 'Kislev', 'Tevet', 'Shevat', 'Adar I',
-                 'Adar II', 'Nisan', 'Iyar', 'Sivan', 'Tamuz', 'Av', 'Elul')
         if self.month == self.ADAR_II and not self.isLeapYear:
             return 'Adar II'
         else:
-            return names[self.month - 1]
+            return _MONTH_NAMES[self.month - 1]
+
+    def __reduce__(self):
+        # Needed for pickling because __slots__ leaves no __dict__ to save.
+        return type(self), (self.year, self.month, self.day)
 
     def _invalid_date_error(self):
         return InvalidDateError('%r represents an invalid date' % self)
@@ -305,12 +250,171 @@ class JewishDate(object):
                                    self.year, self.month, self.day)
 
 
-def _get_first_day_of_year(metonicCycleYear, molad):
+def _build_month_starts():
+    """Build the months of each possible length of year.
+
+    Returns:
+        a dict mapping each year length to a tuple (monthNumbers,
+        monthStarts), where monthStarts[i] is the number of days from Tishrei 1
+        to the first day of month monthNumbers[i]
+    """
+    result = {}
+    for _, yearLength, cheshvanLength, kislevLength, isLeapYear in (
+            KEVIYAH_TABLE):
+        monthLengths = [
+            (JewishDate.TISHREI, 30),
+            (JewishDate.CHESHVAN, cheshvanLength),
+            (JewishDate.KISLEV, kislevLength),
+            (JewishDate.TEVET, 29),
+            (JewishDate.SHEVAT, 30),
+        ]
+        if isLeapYear:
+            monthLengths.append((JewishDate.ADAR_I, 30))
+        monthLengths.extend([
+            (JewishDate.ADAR_II, 29),
+            (JewishDate.NISAN, 30),
+            (JewishDate.IYAR, 29),
+            (JewishDate.SIVAN, 30),
+            (JewishDate.TAMUZ, 29),
+            (JewishDate.AV, 30),
+            (JewishDate.ELUL, 29),
+        ])
+        monthNumbers = []
+        monthStarts = []
+        start = 0
+        for month, length in monthLengths:
+            monthNumbers.append(month)
+            monthStarts.append(start)
+            start += length
+        result[yearLength] = (tuple(monthNumbers), tuple(monthStarts))
+    return result
+
+_MONTH_STARTS = _build_month_starts()
+
+# Conversions are pure functions of their (immutable) arguments, so their
+# results can safely be shared process-wide without ever being invalidated.
+@lru_cache(maxsize=4096)
+def _from_sdn(sdn):
+    """Convert a serial day number (SDN) to a Jewish date.
+
+    Args:
+        sdn: a serial day number
+
+    Returns:
+        a tuple (year, month, day)
+
+    Raises:
+        InvalidDateError: if the input SDN is before the beginning of Jewish
+                          year 1
+    """
+    if sdn <= _JEWISH_SDN_OFFSET:
+        raise InvalidDateError(
+            'Serial day number %s is before the first Jewish year' % sdn)
+    inputDay = sdn - _JEWISH_SDN_OFFSET
+
+    if _MODERN_TISHREI1S[0] <= inputDay < _MODERN_TISHREI1S[-1]:
+        # Most dates are modern, so their years are found in a precomputed
+        # table of year starts rather than by calculating moladot.
+        index = bisect.bisect_right(_MODERN_TISHREI1S, inputDay) - 1
+        tishrei1 = _MODERN_TISHREI1S[index]
+        return _date_in_year(_MODERN_FIRST_YEAR + index, inputDay - tishrei1,
+                             _MODERN_TISHREI1S[index + 1] - tishrei1)
+
+    metonicCycle, metonicYear, moladDay, moladHalakim = (
+        _find_nearby_tishrei_molad(inputDay))
+    year = metonicCycle * 19 + metonicYear + 1
+    tishrei1, yearLength = _get_tishrei1_pair(metonicYear, moladDay,
+                                              moladHalakim)
+    if inputDay < tishrei1:
+        # It found Tishrei 1 at the end of the year, so step back to the molad
+        # at the start of this year.
+        year -= 1
+        metonicYear = (metonicYear - 1) % 19
+        days, moladHalakim = divmod(
+            moladHalakim - _YEAR_HALAKIM[metonicYear], HALAKIM_PER_DAY)
+        moladDay += days
+        tishrei1, yearLength = _get_tishrei1_pair(metonicYear, moladDay,
+                                                  moladHalakim)
+    return _date_in_year(year, inputDay - tishrei1, yearLength)
+
+def _date_in_year(year, dayOfYear, yearLength):
+    """Find the month and day of a day of a year.
+
+    Args:
+        year: the year
+        dayOfYear: the number of days since Tishrei 1 of the year
+        yearLength: the number of days in the year
+
+    Returns:
+        a tuple (year, month, day)
+    """
+    monthNumbers, monthStarts = _MONTH_STARTS[yearLength]
+    index = bisect.bisect_right(monthStarts, dayOfYear) - 1
+    return year, monthNumbers[index], dayOfYear - monthStarts[index] + 1
+
+def _build_month_offsets(adarsLength):
+    """Build the offsets used by _to_sdn for each month except Kislev.
+
+    Args:
+        adarsLength: the total length of Adar I and Adar II, or of Adar
+
+    Returns:
+        a dict mapping each month to its offset: from the day before Tishrei 1
+        for Tishrei and Cheshvan, and back from the next Tishrei 1 otherwise
+    """
+    return {
+        JewishDate.TISHREI: -1,
+        JewishDate.CHESHVAN: 29,
+        # Kislev is variable
+        JewishDate.TEVET: adarsLength + 237,
+        JewishDate.SHEVAT: adarsLength + 208,
+        JewishDate.ADAR_I: adarsLength + 178,
+        JewishDate.ADAR_II: 207,
+        JewishDate.NISAN: 178,
+        JewishDate.IYAR: 148,
+        JewishDate.SIVAN: 119,
+        JewishDate.TAMUZ: 89,
+        JewishDate.AV: 60,
+        JewishDate.ELUL: 30,
+    }
+
+# The month offsets for non-leap and leap years, in that order.
+_MONTH_OFFSETS = (_build_month_offsets(29), _build_month_offsets(59))
+
+@lru_cache(maxsize=4096)
+def _to_sdn(year, month, day):
+    """Convert a Jewish date to serial day number (SDN).
+
+    Args:
+        year: the year (must be >= 1)
+        month: the month
+        day: the day (must be in the range 1-30 inclusive)
+
+    Returns:
+        a serial day number (integer)
+
+    Raises:
+        KeyError: if month is not a valid month
+    """
+    tishrei1, keviyah = _find_start_of_year(year)
+    _, yearLength, cheshvanLength, _, _ = keviyah
+    nextTishrei1 = tishrei1 + yearLength
+    offset = _MONTH_OFFSETS[is_leap_year(year)]
+    if month in (JewishDate.TISHREI, JewishDate.CHESHVAN):
+        sdn = tishrei1 + day + offset[month]
+    elif month == JewishDate.KISLEV:
+        sdn = tishrei1 + day + 29 + cheshvanLength
+    else:
+        sdn = nextTishrei1 + day - offset[month]
+    return sdn + _JEWISH_SDN_OFFSET
+
+def _get_first_day_of_year(metonicCycleYear, moladDay, moladHalakim):
     """Calculate which day a year starts on.
 
     Args:
         cycleYear: year of 19-year cycle (0-18)
-        molad: a _Molad object
+        moladDay: the day of the molad
+        moladHalakim: the halakim of the molad (< HALAKIM_PER_DAY)
 
     Returns:
         the serial day number of the first day of the year
@@ -322,28 +426,47 @@ def _get_first_day_of_year(metonicCycleYear, molad):
     (called dehiyyot) delays it. These 4 rules can delay the start of the year
     by as much as 2 days.
     """
-    tishrei1 = molad.day
-    dow = molad.day_of_week()
-    lastWasLeapYear = ((metonicCycleYear - 1) % 19) in LEAP_YEARS
+    tishrei1 = moladDay
+    dow = moladDay % 7
+    lastWasLeapYear = (_LEAP_MASK >> ((metonicCycleYear - 1) % 19)) & 1
 
     # Apply rules 2, 3, and 4
-    if (molad.halakim >= _NOON
-            or (metonicCycleYear not in LEAP_YEARS
+    if (moladHalakim >= _NOON
+            or (not (_LEAP_MASK >> metonicCycleYear) & 1
                     and dow == _TUESDAY
-                    and molad.halakim >= _AM3_11_20)
+                    and moladHalakim >= _AM3_11_20)
             or (lastWasLeapYear
                     and dow == _MONDAY
-                    and molad.halakim >= _AM9_32_43)):
+                    and moladHalakim >= _AM9_32_43)):
         tishrei1 += 1
         dow = (dow + 1) % 7
 
     # Apply rule 1 after the others because it can cause an additional delay of
     # one day.
-    if dow in (_WEDNESDAY, _FRIDAY, _SUNDAY):
+    if (_ADU_MASK >> dow) & 1:
         tishrei1 += 1
 
     return tishrei1
 
+def _get_tishrei1_pair(metonicYear, moladDay, moladHalakim):
+    """Calculate which day a year starts on and how long it is.
+
+    Args:
+        metonicYear: year of 19-year cycle (0-18)
+        moladDay: the day of the molad which starts the year
+        moladHalakim: the halakim of the molad (< HALAKIM_PER_DAY)
+
+    Returns:
+        the tuple (tishrei1, yearLength)
+
+    This gives the same results as calling _get_first_day_of_year for the
+    year and the one after it, but both are read from a single keviyah lookup.
+    """
+    roshDow, yearLength, _, _, _ = _keviyah(metonicYear, moladDay,
+                                            moladHalakim)
+    return moladDay + (roshDow - moladDay) % 7, yearLength
+
+@lru_cache(maxsize=None)
 def _molad_of_metonic_cycle(metonicCycle):
     """Calculate the date and time of the molad that starts a metonic cycle.
 
@@ -351,15 +474,16 @@ def _molad_of_metonic_cycle(metonicCycle):
         metonicCycle: the number of the metonic cycle
 
     Returns:
-        a _Molad object representing the molad
+        a tuple (day, halakim) representing the molad
 
     Since the length of a metonic cycle is a constant, this is a simple
     calculation, except that it requires an intermediate value which is bigger
     than 32 bits. Since Python automatically uses unlimited precision integers
-    when necessary, this is does not pose a challenge, unlike in C.
+    when necessary, this is does not pose a challenge, unlike in C. Results
+    are cached because only a few hundred cycles cover all realistic dates.
     """
-    return _Molad(halakim=_NEW_MOON_OF_CREATION).add_metonic_cycles(
-        metonicCycle)
+    return divmod(_NEW_MOON_OF_CREATION
+                  + HALAKIM_PER_METONIC_CYCLE * metonicCycle, HALAKIM_PER_DAY)
 
 def _find_nearby_tishrei_molad(inputDay):
     """Find the closes molad of Tishrei to a given day number.
@@ -368,14 +492,13 @@ def _find_nearby_tishrei_molad(inputDay):
         inputDay: a serial day number
 
     Returns:
-        a tuple (metonicCycle, metonicYear, molad)
+        a tuple (metonicCycle, metonicYear, moladDay, moladHalakim)
 
     It's not really the *closest* molad that we want here. If the input day is
     in the first two months, we want the molad at the start of the year. If the
     input day is in the fourth to last months, we want the molad at the end of
     the year. If the input day is in the third month, it doesn't matter which
-    molad is returned, because both will be required. This type of "rounding"
-    allows us to avoid calculating the length of the year in most cases.
+    molad is returned, because both will be required.
     """
     # Estimate the metonic cycle number. Note that this may be an under
     # estimate because there are 6939.6896 days in a metonic cycle not 6940,
@@ -384,24 +507,27 @@ def _find_nearby_tishrei_molad(inputDay):
     metonicCycle = (inputDay + 310) // 6940
 
     # Calculate the time of the starting molad for this metonic cycle.
-    molad = _molad_of_metonic_cycle(metonicCycle)
+    day, halakim = _molad_of_metonic_cycle(metonicCycle)
 
     # If the above was an under estimate, increment the cycle number until the
     # correct one is found. For modern dates this loop is about 98.6% likely to
     # not execute, even once, because the above estimate is really quite close.
-    while molad.day < inputDay - 6940 + 310:
+    while day < inputDay - 6940 + 310:
         metonicCycle += 1
-        molad.add_metonic_cycles(1)
+        days, halakim = divmod(halakim + HALAKIM_PER_METONIC_CYCLE,
+                               HALAKIM_PER_DAY)
+        day += days
 
-    # Find the molad of Tishrei closest to this date.
-    metonicYear = 0
-    while metonicYear < 18:  # Not quite the same as a for loop over range(18)
-        if molad.day > inputDay - 74:
-            break
-        molad.add_lunar_cycles(months_in_metonic_year(metonicYear))
-        metonicYear += 1
+    # Find the molad of Tishrei closest to this date: the first one in the
+    # cycle that falls after inputDay - 74, or the last one if none does.
+    metonicYear = min(18, bisect.bisect_left(
+        _YEAR_OFFSET_HALAKIM,
+        (inputDay - 74 - day + 1) * HALAKIM_PER_DAY - halakim))
+    days, halakim = divmod(halakim + _YEAR_OFFSET_HALAKIM[metonicYear],
+                           HALAKIM_PER_DAY)
+    day += days
 
-    return metonicCycle, metonicYear, molad
+    return metonicCycle, metonicYear, day, halakim
 
 def _find_start_of_year(year):
     """Find the serial day number of the the first day of a Jewish year.
@@ -410,11 +536,96 @@ def _find_start_of_year(year):
         year: the number of a Jewish calendar year
 
     Returns:
-        the tuple (metonicCycle, metonicYear, molad, tishrei1)
+        the tuple (tishrei1, keviyah) where keviyah is the row of
+        KEVIYAH_TABLE describing the year
     """
     metonicCycle, metonicYear = divmod(year - 1, 19)
-    molad = _molad_of_metonic_cycle(metonicCycle)
+    moladDay, moladHalakim = _molad_of_metonic_cycle(metonicCycle)
+    days, moladHalakim = divmod(
+        moladHalakim + HALAKIM_PER_LUNAR_CYCLE * _YEAR_OFFSET[metonicYear],
+        HALAKIM_PER_DAY)
+    moladDay += days
+    keviyah = _keviyah(metonicYear, moladDay, moladHalakim)
+    tishrei1 = moladDay + (keviyah[0] - moladDay) % 7
+    return tishrei1, keviyah
+
+def _keviyah(metonicYear, moladDay, moladHalakim):
+    """Look up the type of a year from the time of its molad of Tishrei.
 
-    molad.add_lunar_cycles(_YEAR_OFFSET[metonicYear])
-    tishrei1 = _get_first_day_of_year(metonicYear, molad)
-    return (metonicCycle, metonicYear, molad, tishrei1)
+    Args:
+        metonicYear: year of 19-year cycle (0-18)
+        moladDay: the day of the molad
+        moladHalakim: the halakim of the molad (< HALAKIM_PER_DAY)
+
+    Returns:
+        the row of KEVIYAH_TABLE describing the year
+    """
+    thresholds, keviyot = _GATES[metonicYear]
+    index = bisect.bisect_right(
+        thresholds, moladDay % 7 * HALAKIM_PER_DAY + moladHalakim) - 1
+    return keviyot[index]
+
+def _build_gate(metonicYear):
+    """Partition the week according to the keviyah a molad in it would produce.
+
+    Args:
+        metonicYear: year of 19-year cycle (0-18)
+
+    Returns:
+        a tuple (thresholds, keviyot) where keviyot[i] is the row of
+        KEVIYAH_TABLE for a year whose molad of Tishrei falls at least
+        thresholds[i] halakim (but less than thresholds[i + 1]) after the
+        start of the week
+
+    The type of a year depends only on the position within the week of its
+    molad and the molad of the following year, and on which of the years
+    around it are leap years. This is the classic "Four Gates" table.
+    """
+    yearHalakim = HALAKIM_PER_LUNAR_CYCLE * months_in_metonic_year(metonicYear)
+    # The dehiyyot can only change their outcome at these times, for either
+    # this year's molad or the next one's.
+    points = set()
+    for day in range(7):
+        for halakim in (0, _AM3_11_20, _AM9_32_43, _NOON):
+            point = day * HALAKIM_PER_DAY + halakim
+            points.add(point)
+            points.add((point - yearHalakim) % HALAKIM_PER_WEEK)
+    keviyahIndex = dict((keviyah[:2], keviyah) for keviyah in KEVIYAH_TABLE)
+    thresholds = []
+    keviyot = []
+    for point in sorted(points):
+        # Start a week in so that the day numbers are not negative.
+        moladDay, moladHalakim = divmod(HALAKIM_PER_WEEK + point,
+                                        HALAKIM_PER_DAY)
+        tishrei1 = _get_first_day_of_year(metonicYear, moladDay, moladHalakim)
+        moladDay, moladHalakim = divmod(
+            HALAKIM_PER_WEEK + point + yearHalakim, HALAKIM_PER_DAY)
+        nextTishrei1 = _get_first_day_of_year((metonicYear + 1) % 19,
+                                              moladDay, moladHalakim)
+        keviyah = keviyahIndex[(tishrei1 % 7, nextTishrei1 - tishrei1)]
+        if not keviyot or keviyot[-1] is not keviyah:
+            thresholds.append(point)
+            keviyot.append(keviyah)
+    return tuple(thresholds), tuple(keviyot)
+
+def _build_gates():
+    """Build the keviyah lookup table for each year of the metonic cycle."""
+    gates = {}
+    result = []
+    for metonicYear in range(19):
+        key = tuple((_LEAP_MASK >> ((metonicYear + offset) % 19)) & 1
+                    for offset in (-1, 0, 1))
+        if key not in gates:
+            gates[key] = _build_gate(metonicYear)
+        result.append(gates[key])
+    return tuple(result)
+
+_GATES = _build_gates()
+
+# Tishrei 1 of each year from _MODERN_FIRST_YEAR through _MODERN_LAST_YEAR + 1,
+# so that dates in those years (1739-2740 CE) can be converted directly.
+_MODERN_FIRST_YEAR = 5500
+_MODERN_LAST_YEAR = 6500
+_MODERN_TISHREI1S = tuple(
+    _find_start_of_year(year)[0]
+    for year in range(_MODERN_FIRST_YEAR, _MODERN_LAST_YEAR + 2))
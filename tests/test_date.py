@@ -0,0 +1,186 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import copy
+import datetime
+import pickle
+import unittest
+
+from jewish import JewishDate
+from jewish import date as jdate
+
+
+class FromSdnsTest(unittest.TestCase):
+
+    def assert_matches_from_sdn(self, sdns):
+        years, months, days = JewishDate.from_sdns(sdns)
+        self.assertEqual(len(sdns), len(years))
+        self.assertEqual(len(sdns), len(months))
+        self.assertEqual(len(sdns), len(days))
+        for sdn, year, month, day in zip(sdns, years, months, days):
+            date = JewishDate.from_sdn(sdn)
+            self.assertEqual((date.year, date.month, date.day),
+                             (year, month, day), 'SDN %s' % sdn)
+
+    def test_consecutive_days(self):
+        # Three years, so every month and both kinds of year boundary are
+        # crossed, including Adar I of the leap year 5779.
+        start = JewishDate(5778, 1, 1).to_sdn()
+        end = JewishDate(5781, 1, 1).to_sdn()
+        self.assert_matches_from_sdn(list(range(start, end + 1)))
+
+    def test_consecutive_days_far_from_modern_years(self):
+        start = JewishDate(3000, 12, 1).to_sdn()
+        self.assert_matches_from_sdn(list(range(start, start + 400)))
+
+    def test_repeated_and_non_consecutive_days(self):
+        sdn = JewishDate(5779, 6, 28).to_sdn()
+        self.assert_matches_from_sdn([sdn, sdn, sdn + 1, sdn + 1, sdn + 2,
+                                      sdn - 40, sdn + 3, sdn + 1000, sdn + 2])
+
+    def test_iterator_input(self):
+        sdn = JewishDate(5780, 2, 25).to_sdn()
+        years, months, days = JewishDate.from_sdns(iter(range(sdn, sdn + 10)))
+        self.assertEqual(10, len(days))
+        self.assertEqual((5780, JewishDate.KISLEV, 4),
+                         (years[-1], months[-1], days[-1]))
+
+    def test_empty_input(self):
+        self.assertEqual(([], [], []), JewishDate.from_sdns([]))
+
+
+class KeviyahTest(unittest.TestCase):
+
+    def check_molad(self, metonicYear, point):
+        # Start well into the calendar so that day numbers are positive.
+        halakim = 100 * jdate.HALAKIM_PER_WEEK + point
+        moladDay, moladHalakim = divmod(halakim, jdate.HALAKIM_PER_DAY)
+        tishrei1 = jdate._get_first_day_of_year(metonicYear, moladDay,
+                                                moladHalakim)
+        nextMoladDay, nextMoladHalakim = divmod(
+            halakim + jdate._YEAR_HALAKIM[metonicYear], jdate.HALAKIM_PER_DAY)
+        nextTishrei1 = jdate._get_first_day_of_year(
+            (metonicYear + 1) % 19, nextMoladDay, nextMoladHalakim)
+        roshDow, yearLength, _, _, isLeapYear = jdate._keviyah(
+            metonicYear, moladDay, moladHalakim)
+        message = 'metonicYear %s, molad %s' % (metonicYear, point)
+        self.assertEqual(tishrei1 % 7, roshDow, message)
+        self.assertEqual(nextTishrei1 - tishrei1, yearLength, message)
+        self.assertEqual(metonicYear in jdate.LEAP_YEARS, isLeapYear, message)
+        self.assertEqual((tishrei1, yearLength),
+                         jdate._get_tishrei1_pair(metonicYear, moladDay,
+                                                  moladHalakim), message)
+
+    def test_thresholds_match_dehiyyot(self):
+        for metonicYear in range(19):
+            thresholds, _ = jdate._GATES[metonicYear]
+            for threshold in thresholds:
+                for point in (threshold - 1, threshold, threshold + 1):
+                    self.check_molad(metonicYear,
+                                     point % jdate.HALAKIM_PER_WEEK)
+
+    def test_whole_week_matches_dehiyyot(self):
+        for metonicYear in range(19):
+            for point in range(0, jdate.HALAKIM_PER_WEEK, 997):
+                self.check_molad(metonicYear, point)
+
+
+class ConversionTest(unittest.TestCase):
+
+    def assert_date(self, expected, date):
+        self.assertEqual(expected, (date.year, date.month, date.day))
+
+    def test_known_dates(self):
+        self.assert_date((5777, JewishDate.ELUL, 12),
+                         JewishDate.from_sdn(2458000))
+        for gregorian, jewish in (
+                ((2016, 8, 17), (5776, JewishDate.AV, 13)),
+                ((2016, 10, 3), (5777, JewishDate.TISHREI, 1)),
+                ((2019, 2, 6), (5779, JewishDate.ADAR_I, 1)),
+                ((2019, 9, 30), (5780, JewishDate.TISHREI, 1)),
+                ((2024, 4, 23), (5784, JewishDate.NISAN, 15))):
+            self.assert_date(jewish,
+                             JewishDate.from_date(datetime.date(*gregorian)))
+            self.assertEqual(datetime.date(*gregorian),
+                             JewishDate(*jewish).to_date())
+
+    def test_first_day(self):
+        self.assert_date((1, JewishDate.TISHREI, 1),
+                         JewishDate.from_sdn(jdate._JEWISH_SDN_OFFSET + 1))
+        self.assertRaises(jdate.InvalidDateError, JewishDate.from_sdn,
+                          jdate._JEWISH_SDN_OFFSET)
+
+    def check_round_trip(self, year):
+        start = JewishDate(year, JewishDate.TISHREI, 1).to_sdn()
+        end = JewishDate(year + 1, JewishDate.TISHREI, 1).to_sdn()
+        self.assertIn(end - start, (353, 354, 355, 383, 384, 385))
+        self.assertEqual(JewishDate(year, 1, 1).isLeapYear, end - start > 380)
+        for sdn in range(start, end):
+            date = JewishDate.from_sdn(sdn)
+            self.assertEqual(year, date.year)
+            self.assertEqual(sdn, date.to_sdn())
+
+    def test_round_trip(self):
+        # A full metonic cycle of leap and non-leap years in several eras,
+        # including ones outside the table of modern years.
+        for firstYear in (1, 3001, 5768, 9001):
+            for year in range(firstYear, firstYear + 19):
+                self.check_round_trip(year)
+
+
+class ModernTableTest(unittest.TestCase):
+    """Dates around the edges of the table of modern years."""
+
+    def check_new_year(self, year):
+        # The table is only used from Tishrei 1 of _MODERN_FIRST_YEAR up to
+        # the end of _MODERN_LAST_YEAR, so these cross between the two paths.
+        tishrei1 = (jdate._find_start_of_year(year)[0]
+                    + jdate._JEWISH_SDN_OFFSET)
+        for sdn, expected in (
+                (tishrei1 - 2, (year - 1, JewishDate.ELUL, 28)),
+                (tishrei1 - 1, (year - 1, JewishDate.ELUL, 29)),
+                (tishrei1, (year, JewishDate.TISHREI, 1)),
+                (tishrei1 + 1, (year, JewishDate.TISHREI, 2))):
+            date = JewishDate.from_sdn(sdn)
+            self.assertEqual(expected, (date.year, date.month, date.day))
+            self.assertEqual(sdn, date.to_sdn())
+
+    def test_first_year(self):
+        self.assertEqual(5500, jdate._MODERN_FIRST_YEAR)
+        self.check_new_year(5500)
+
+    def test_after_last_year(self):
+        self.assertEqual(6500, jdate._MODERN_LAST_YEAR)
+        self.check_new_year(6501)
+
+    def test_table_matches_year_starts(self):
+        for index, tishrei1 in enumerate(jdate._MODERN_TISHREI1S):
+            self.assertEqual(
+                jdate._find_start_of_year(jdate._MODERN_FIRST_YEAR + index)[0],
+                tishrei1)
+
+
+class PickleTest(unittest.TestCase):
+
+    def assert_same_date(self, expected, actual):
+        self.assertIs(type(expected), type(actual))
+        self.assertEqual(
+            (expected.year, expected.month, expected.day,
+             expected.isLeapYear),
+            (actual.year, actual.month, actual.day, actual.isLeapYear))
+
+    def test_pickle_every_protocol(self):
+        date = JewishDate.from_sdn(2457000)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assert_same_date(
+                date, pickle.loads(pickle.dumps(date, protocol)))
+
+    def test_deepcopy(self):
+        date = JewishDate(5779, JewishDate.ADAR_I, 30)
+        self.assert_same_date(date, copy.deepcopy(date))
+
+
+if __name__ == '__main__':
+    unittest.main()